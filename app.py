@@ -1,19 +1,15 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import json
 
-# Set page configuration
-st.set_page_config(
-    page_title="GRS System Modernization Analysis",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Add custom CSS with improved styling
-st.markdown("""
+# Static page content. Streamlit drops any element that is not re-emitted on
+# a rerun, so these cannot be written once behind a session_state guard;
+# they are kept here as constants so the layout code below stays compact.
+CUSTOM_CSS = """
     <style>
     .main {
         padding: 0rem 1rem;
@@ -37,7 +33,169 @@ st.markdown("""
         margin: 20px 0;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+KEY_FINDINGS_MD = """
+    ### Key Findings
+    
+    1. 🚀 **Development Speed**
+       - Azure Power Apps shows significant advantages in rapid development
+       - Faster time-to-market by approximately 30%
+    
+    2. 💰 **Cost Structure**
+       - Initial costs vary by implementation scope
+       - Long-term TCO generally favors Azure Power Apps
+    
+    3. 📈 **Scalability**
+       - Azure Power Apps provides better built-in scalability
+       - Lower infrastructure management overhead
+    
+    4. 🛠️ **Customization**
+       - Traditional Microsoft Stack offers more flexibility
+       - Better suited for complex custom requirements
+    """
+
+RECOMMENDED_APPROACH_MD = """
+    ### Recommended Approach
+    
+    #### Azure Power Apps Focus:
+    - Standard workflows
+    - User interfaces
+    - Basic business processes
+    - Mobile access requirements
+    - Rapid prototyping needs
+    
+    #### Traditional Microsoft Stack Focus:
+    - Complex calculations
+    - Custom integrations
+    - Performance-critical operations
+    - Legacy system interfaces
+    - Specialized security requirements
+    """
+
+# Set page configuration
+st.set_page_config(
+    page_title="GRS System Modernization Analysis",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Create comparison data
+_FACTORS = (
+    'Development Speed',
+    'Scalability',
+    'Initial Cost',
+    'Ongoing Cost',
+    'Customizability',
+    'Maintenance Effort',
+    'Time-to-Market',
+    'Security Features',
+    'Integration Capability',
+    'Learning Curve'
+)
+_COMPARISON_MS = np.array([7, 6, 8, 7, 9, 6, 7, 8, 9, 8], dtype=np.int32)
+_COMPARISON_PA = np.array([9, 9, 6, 7, 7, 8, 9, 9, 8, 6], dtype=np.int32)
+
+@st.cache_data(show_spinner=False)
+def _comparison_df():
+    df = pd.DataFrame({
+        'Factor': pd.Categorical(_FACTORS),
+        'Microsoft Stack': _COMPARISON_MS,
+        'Azure Power Apps': _COMPARISON_PA
+    })
+    df['Difference'] = df['Azure Power Apps'] - df['Microsoft Stack']
+    return df
+
+# Timeline data with more detailed breakdown
+_PHASES = (
+    'Environment Setup',
+    'Base Implementation',
+    'Core Features',
+    'Integration',
+    'Testing',
+    'Deployment'
+)
+_TIMELINE_MS = np.array([30, 45, 60, 45, 30, 15], dtype=np.int32)
+_TIMELINE_PA = np.array([15, 30, 45, 30, 30, 15], dtype=np.int32)
+_RISK_LEVELS = ('Low', 'Medium', 'High', 'High', 'Medium', 'Low')
+
+@st.cache_data(show_spinner=False)
+def _timeline_df():
+    return pd.DataFrame({
+        'Phase': pd.Categorical(_PHASES),
+        'Microsoft Stack': _TIMELINE_MS,
+        'Azure Power Apps': _TIMELINE_PA,
+        'Risk Level': pd.Categorical(_RISK_LEVELS)
+    })
+
+# Enhanced cost breakdown data
+_COST_CATEGORIES = (
+    'Licensing',
+    'Infrastructure',
+    'Development',
+    'Training',
+    'Maintenance'
+)
+_COSTS_MS = np.array([50000, 30000, 80000, 20000, 25000], dtype=np.int32)
+_COSTS_PA = np.array([70000, 15000, 60000, 30000, 15000], dtype=np.int32)
+
+@st.cache_data(show_spinner=False)
+def _cost_df():
+    return pd.DataFrame({
+        'Category': pd.Categorical(_COST_CATEGORIES),
+        'Microsoft Stack': _COSTS_MS,
+        'Azure Power Apps': _COSTS_PA
+    })
+
+# Feature support matrix
+_FEATURES = (
+    'Built-in Security',
+    'Compliance Tools',
+    'Mobile Support',
+    'Custom Development',
+    'Third-party Integration',
+    'Automated Testing',
+    'Version Control',
+    'Deployment Automation',
+    'Performance Monitoring',
+    'Disaster Recovery'
+)
+_FEATURES_MS = ('✅', '✅', '⚠️', '✅', '✅', '✅', '✅', '✅', '✅', '✅')
+_FEATURES_PA = ('✅', '✅', '✅', '⚠️', '✅', '✅', '✅', '✅', '✅', '✅')
+_FEATURE_NOTES = (
+    'Both platforms offer enterprise-grade security',
+    'Built-in compliance features in both',
+    'Native in Power Apps, requires custom dev in MS Stack',
+    'Full control in MS Stack, limited in Power Apps',
+    'Extensive integration capabilities in both',
+    'Built-in testing tools available',
+    'Standard source control integration',
+    'CI/CD pipeline support',
+    'Comprehensive monitoring tools',
+    'Built-in DR capabilities'
+)
+
+@st.cache_data(show_spinner=False)
+def _features_df():
+    return pd.DataFrame({
+        'Feature': _FEATURES,
+        'Microsoft Stack': _FEATURES_MS,
+        'Azure Power Apps': _FEATURES_PA,
+        'Notes': _FEATURE_NOTES
+    })
+
+df_comparison = _comparison_df()
+df_timeline = _timeline_df()
+df_costs = _cost_df()
+df_features = _features_df()
+
+# Add custom CSS with improved styling
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# CSV exports, encoded once per table
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    return df.to_csv(index=False).encode()
 
 # Sidebar
 with st.sidebar:
@@ -56,8 +214,8 @@ with st.sidebar:
     min_score = st.slider("Minimum Score Filter", 0, 10, 0)
     selected_factors = st.multiselect(
         "Factor Focus",
-        ['Development Speed', 'Scalability', 'Cost', 'Customizability', 'Security'],
-        ['Development Speed', 'Cost']
+        df_comparison['Factor'].tolist(),
+        help="Leave empty to include every factor"
     )
     
     # Export options
@@ -65,166 +223,81 @@ with st.sidebar:
     if st.button("Export Analysis as PDF"):
         st.info("PDF export functionality will be implemented in the next version")
     
-    if st.button("Download Raw Data (CSV)"):
-        st.download_button(
-            label="Download Data",
-            data=df_comparison.to_csv(index=False),
-            file_name="comparison_data.csv",
-            mime="text/csv"
-        )
+    st.download_button(
+        label="Download Raw Data (CSV)",
+        data=to_csv_bytes(df_comparison),
+        file_name="comparison_data.csv",
+        mime="text/csv"
+    )
 
 # Title with improved styling
 st.title("🚀 GRS System Modernization Options Comparison")
 st.markdown("### Comprehensive Analysis: Microsoft Stack vs Azure Power Apps")
 
-# Create comparison data
-comparison_data = {
-    'Factor': [
-        'Development Speed',
-        'Scalability',
-        'Initial Cost',
-        'Ongoing Cost',
-        'Customizability',
-        'Maintenance Effort',
-        'Time-to-Market',
-        'Security Features',
-        'Integration Capability',
-        'Learning Curve'
-    ],
-    'Microsoft Stack': [7, 6, 8, 7, 9, 6, 7, 8, 9, 8],
-    'Azure Power Apps': [9, 9, 6, 7, 7, 8, 9, 9, 8, 6]
-}
-
-df_comparison = pd.DataFrame(comparison_data)
-
-# Timeline data with more detailed breakdown
-timeline_data = {
-    'Phase': [
-        'Environment Setup',
-        'Base Implementation',
-        'Core Features',
-        'Integration',
-        'Testing',
-        'Deployment'
-    ],
-    'Microsoft Stack': [30, 45, 60, 45, 30, 15],
-    'Azure Power Apps': [15, 30, 45, 30, 30, 15],
-    'Risk Level': ['Low', 'Medium', 'High', 'High', 'Medium', 'Low']
-}
-
-df_timeline = pd.DataFrame(timeline_data)
+# Display-only charts skip plotly.js event binding and the modebar entirely
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+HOVER_CHART_CONFIG = {'displayModeBar': False}
 
-# Enhanced cost breakdown data
-cost_breakdown = {
-    'Category': [
-        'Licensing',
-        'Infrastructure',
-        'Development',
-        'Training',
-        'Maintenance'
-    ],
-    'Microsoft Stack': [50000, 30000, 80000, 20000, 25000],
-    'Azure Power Apps': [70000, 15000, 60000, 30000, 15000]
-}
-
-df_costs = pd.DataFrame(cost_breakdown)
-
-# Create tabs with enhanced styling
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "📊 Comparison Matrix",
-    "⏱️ Timeline Analysis",
-    "💰 Cost Analysis",
-    "✨ Feature Comparison",
-    "📈 ROI Calculator"
-])
-
-with tab1:
-    st.header("Comprehensive Comparison Matrix")
+# Chart builders, cached on hashable tuples of their input columns
+@st.cache_resource(show_spinner=False)
+def build_radar(factors, ms_scores, pa_scores, animate=True):
+    fig = go.Figure()
     
-    col1, col2 = st.columns([2, 1])
+    fig.add_trace(go.Scatterpolargl(
+        r=list(ms_scores),
+        theta=list(factors),
+        fill='toself',
+        name='Microsoft Stack',
+        line_color='#1f77b4'
+    ))
     
-    with col1:
-        # Enhanced radar chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatterpolar(
-            r=df_comparison['Microsoft Stack'],
-            theta=df_comparison['Factor'],
-            fill='toself',
-            name='Microsoft Stack',
-            line_color='#1f77b4'
-        ))
-        
-        fig.add_trace(go.Scatterpolar(
-            r=df_comparison['Azure Power Apps'],
-            theta=df_comparison['Factor'],
-            fill='toself',
-            name='Azure Power Apps',
-            line_color='#ff7f0e'
-        ))
-        
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 10],
-                    tickfont=dict(size=10)
-                )),
-            showlegend=True,
-            height=600,
-            title="Radar Analysis of Key Factors"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+    fig.add_trace(go.Scatterpolargl(
+        r=list(pa_scores),
+        theta=list(factors),
+        fill='toself',
+        name='Azure Power Apps',
+        line_color='#ff7f0e'
+    ))
     
-    with col2:
-        st.markdown("### Score Summary")
-        # Create a summary DataFrame for better presentation
-        summary_df = pd.DataFrame({
-            'Factor': df_comparison['Factor'],
-            'Microsoft Stack': df_comparison['Microsoft Stack'],
-            'Azure Power Apps': df_comparison['Azure Power Apps'],
-            'Difference': df_comparison['Azure Power Apps'] - df_comparison['Microsoft Stack']
-        })
-        
-        # Format the table with highlighting
-        st.dataframe(
-            summary_df.style
-            .format({
-                'Microsoft Stack': '{:.1f}',
-                'Azure Power Apps': '{:.1f}',
-                'Difference': '{:+.1f}'
-            })
-            .background_gradient(subset=['Difference'], cmap='RdYlGn', vmin=-5, vmax=5)
-            .set_properties(**{'text-align': 'center'})
-            .set_table_styles([
-                {'selector': 'th', 'props': [('text-align', 'center')]},
-                {'selector': 'td', 'props': [('text-align', 'center')]}
-            ]),
-            use_container_width=True
-        )
-
-with tab2:
-    st.header("Implementation Timeline Analysis")
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10],
+                tickfont=dict(size=10)
+            )),
+        showlegend=True,
+        height=600,
+        title="Radar Analysis of Key Factors"
+    )
+    if not animate:
+        fig.update_layout(transition_duration=0)
     
-    # Enhanced Gantt-like chart
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_timeline(phases, ms_days, pa_days, risk_levels):
     fig = go.Figure()
     
     colors = {'Low': 'green', 'Medium': 'orange', 'High': 'red'}
+    risk_colors = [colors[risk] for risk in risk_levels]
+    customdata = list(zip(phases, risk_levels))
+    durations = {'Microsoft Stack': ms_days, 'Azure Power Apps': pa_days}
     
+    # One trace per platform; phases stack within it, colored per point by risk
     for platform in ['Microsoft Stack', 'Azure Power Apps']:
-        for i, phase in enumerate(df_timeline['Phase']):
-            fig.add_trace(go.Bar(
-                name=f"{platform} - {phase}",
-                y=[platform],
-                x=[df_timeline.loc[i, platform]],
-                orientation='h',
-                marker_color=colors[df_timeline.loc[i, 'Risk Level']],
-                customdata=[[phase, df_timeline.loc[i, 'Risk Level']]],
-                hovertemplate="<b>%{customdata[0]}</b><br>" +
-                            "Duration: %{x} days<br>" +
-                            "Risk Level: %{customdata[1]}<extra></extra>"
-            ))
+        fig.add_trace(go.Bar(
+            name=platform,
+            y=[platform] * len(phases),
+            x=list(durations[platform]),
+            orientation='h',
+            marker_color=risk_colors,
+            marker_line_width=0,
+            customdata=customdata,
+            hovertemplate="<b>%{customdata[0]}</b><br>" +
+                        "Duration: %{x} days<br>" +
+                        "Risk Level: %{customdata[1]}<extra></extra>"
+        ))
     
     fig.update_layout(
         barmode='stack',
@@ -235,38 +308,34 @@ with tab2:
         title="Implementation Timeline with Risk Levels"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Risk level legend
-    st.markdown("### Risk Levels")
-    cols = st.columns(3)
-    cols[0].markdown("🟢 Low Risk")
-    cols[1].markdown("🟡 Medium Risk")
-    cols[2].markdown("🔴 High Risk")
+    return fig
 
-with tab3:
-    st.header("Detailed Cost Analysis")
-    
-    # Enhanced cost visualization
+@st.cache_resource(show_spinner=False)
+def build_cost_chart(categories, ms_costs, pa_costs):
     fig = go.Figure()
     
+    ms_labels = [f'${x:,.0f}' for x in ms_costs]
+    pa_labels = [f'${x:,.0f}' for x in pa_costs]
+    
     # Add bars for Microsoft Stack
     fig.add_trace(go.Bar(
         name='Microsoft Stack',
-        x=df_costs['Category'],
-        y=df_costs['Microsoft Stack'],
+        x=list(categories),
+        y=list(ms_costs),
         marker_color='#1f77b4',
-        text=df_costs['Microsoft Stack'].apply(lambda x: f'${x:,.0f}'),
+        marker_line_width=0,
+        text=ms_labels,
         textposition='auto',
     ))
     
     # Add bars for Azure Power Apps
     fig.add_trace(go.Bar(
         name='Azure Power Apps',
-        x=df_costs['Category'],
-        y=df_costs['Azure Power Apps'],
+        x=list(categories),
+        y=list(pa_costs),
         marker_color='#ff7f0e',
-        text=df_costs['Azure Power Apps'].apply(lambda x: f'${x:,.0f}'),
+        marker_line_width=0,
+        text=pa_labels,
         textposition='auto',
     ))
     
@@ -278,64 +347,47 @@ with tab3:
         title="Cost Comparison by Category"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Total cost comparison
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        ms_total = df_costs['Microsoft Stack'].sum()
-        st.metric(
-            "Total Microsoft Stack Cost",
-            f"${ms_total:,.2f}",
-            delta=f"${ms_total - df_costs['Azure Power Apps'].sum():,.2f}"
-        )
-    
-    with col2:
-        pa_total = df_costs['Azure Power Apps'].sum()
-        st.metric(
-            "Total Azure Power Apps Cost",
-            f"${pa_total:,.2f}",
-            delta=f"${df_costs['Azure Power Apps'].sum() - ms_total:,.2f}"
-        )
+    return fig
 
-with tab4:
-    st.header("Feature Comparison")
-    
-    features = {
-        'Feature': [
-            'Built-in Security',
-            'Compliance Tools',
-            'Mobile Support',
-            'Custom Development',
-            'Third-party Integration',
-            'Automated Testing',
-            'Version Control',
-            'Deployment Automation',
-            'Performance Monitoring',
-            'Disaster Recovery'
-        ],
-        'Microsoft Stack': ['✅', '✅', '⚠️', '✅', '✅', '✅', '✅', '✅', '✅', '✅'],
-        'Azure Power Apps': ['✅', '✅', '✅', '⚠️', '✅', '✅', '✅', '✅', '✅', '✅'],
-        'Notes': [
-            'Both platforms offer enterprise-grade security',
-            'Built-in compliance features in both',
-            'Native in Power Apps, requires custom dev in MS Stack',
-            'Full control in MS Stack, limited in Power Apps',
-            'Extensive integration capabilities in both',
-            'Built-in testing tools available',
-            'Standard source control integration',
-            'CI/CD pipeline support',
-            'Comprehensive monitoring tools',
-            'Built-in DR capabilities'
-        ]
-    }
-    
-    df_features = pd.DataFrame(features)
-    
-    # Display feature comparison as a styled table
-    st.dataframe(
-        df_features.style
+# RdYlGn sampled at each whole-point Difference from -5 to +5, with the text
+# color background_gradient would pick for contrast. Avoids importing
+# matplotlib just to color ten cells.
+DIFFERENCE_CSS = tuple(
+    f'background-color: #{bg}; color: {fg}' for bg, fg in [
+        ('a50026', '#f1f1f1'), ('d73027', '#f1f1f1'), ('f46d43', '#f1f1f1'),
+        ('fdae61', '#000000'), ('fee08b', '#000000'), ('ffffbf', '#000000'),
+        ('d9ef8b', '#000000'), ('a6d96a', '#000000'), ('66bd63', '#f1f1f1'),
+        ('1a9850', '#f1f1f1'), ('006837', '#f1f1f1')
+    ]
+)
+
+def _difference_css(col):
+    return [DIFFERENCE_CSS[int(np.clip(np.rint(v), -5, 5)) + 5] for v in col]
+
+@st.cache_data(show_spinner=False)
+def styled_summary_html(df):
+    return (
+        df.style
+        .format({
+            'Microsoft Stack': '{:.1f}',
+            'Azure Power Apps': '{:.1f}',
+            'Difference': '{:+.1f}'
+        })
+        .apply(_difference_css, subset=['Difference'])
+        .set_properties(**{'text-align': 'center'})
+        .set_table_styles([
+            {'selector': '', 'props': [('width', '100%')]},
+            {'selector': 'th', 'props': [('text-align', 'center')]},
+            {'selector': 'td', 'props': [('text-align', 'center')]}
+        ])
+        .to_html()
+    )
+
+# The feature matrix never changes, so its HTML has a single cache entry
+@st.cache_resource(show_spinner=False)
+def features_html(df):
+    return (
+        df.style
         .set_properties(**{
             'background-color': 'white',
             'color': 'black',
@@ -343,6 +395,7 @@ with tab4:
             'padding': '10px'
         })
         .set_table_styles([
+            {'selector': '', 'props': [('width', '100%')]},
             {'selector': 'th', 'props': [
                 ('background-color', '#f0f2f6'),
                 ('color', 'black'),
@@ -355,11 +408,114 @@ with tab4:
                 ('padding', '10px')
             ]}
         ])
-        .apply(lambda x: ['background-color: #f8f9fa' if i % 2 == 0 else '' for i in range(len(x))], axis=0),
-        use_container_width=True,
-        height=400
+        .apply(lambda x: ['background-color: #f8f9fa' if i % 2 == 0 else '' for i in range(len(x))], axis=0)
+        .to_html()
+    )
+
+# Calculate estimated costs and ROI
+@st.cache_data(show_spinner=False)
+def calculate_costs_and_roi(users, months, complexity, roi_percentage):
+    complexity_factor = {"Low": 0.8, "Medium": 1.0, "High": 1.3}
+    factor = complexity_factor[complexity]
+    
+    ms_stack_cost = (users * 100 * months + 50000) * factor
+    power_apps_cost = (users * 40 * months + 30000) * factor
+    
+    ms_roi = (ms_stack_cost * (1 + roi_percentage/100)) - ms_stack_cost
+    pa_roi = (power_apps_cost * (1 + roi_percentage/100)) - power_apps_cost
+    
+    return ms_stack_cost, power_apps_cost, ms_roi, pa_roi
+
+# Tab bodies. st.tabs executes every tab on each rerun, so the heavy work
+# inside these lives behind cached builders and becomes a no-op after the
+# first run.
+def render_comparison_tab():
+    st.header("Comprehensive Comparison Matrix")
+    
+    # Apply the sidebar filters once, before anything is charted
+    mask = (
+        (df_comparison['Microsoft Stack'] >= min_score) |
+        (df_comparison['Azure Power Apps'] >= min_score)
+    )
+    if selected_factors:
+        mask &= df_comparison['Factor'].isin(selected_factors)
+    df_filtered = df_comparison[mask]
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Enhanced radar chart
+        fig = build_radar(
+            tuple(df_filtered['Factor']),
+            tuple(df_filtered['Microsoft Stack']),
+            tuple(df_filtered['Azure Power Apps']),
+            animate=enable_animations
+        )
+        
+        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+    
+    with col2:
+        st.markdown("### Score Summary")
+        # Format the table with highlighting
+        st.markdown(styled_summary_html(df_filtered), unsafe_allow_html=True)
+
+def render_timeline_tab():
+    st.header("Implementation Timeline Analysis")
+    
+    # Enhanced Gantt-like chart
+    fig = build_timeline(
+        tuple(df_timeline['Phase']),
+        tuple(df_timeline['Microsoft Stack']),
+        tuple(df_timeline['Azure Power Apps']),
+        tuple(df_timeline['Risk Level'])
+    )
+    
+    # Phase names and risk levels are only shown on hover, so keep it interactive
+    st.plotly_chart(fig, use_container_width=True, config=HOVER_CHART_CONFIG)
+    
+    # Risk level legend
+    st.markdown("### Risk Levels")
+    cols = st.columns(3)
+    cols[0].markdown("🟢 Low Risk")
+    cols[1].markdown("🟡 Medium Risk")
+    cols[2].markdown("🔴 High Risk")
+
+def render_cost_tab():
+    st.header("Detailed Cost Analysis")
+    
+    # Enhanced cost visualization
+    fig = build_cost_chart(
+        tuple(df_costs['Category']),
+        tuple(df_costs['Microsoft Stack']),
+        tuple(df_costs['Azure Power Apps'])
     )
     
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+    
+    # Total cost comparison
+    ms_total, pa_total = df_costs[['Microsoft Stack', 'Azure Power Apps']].sum()
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.metric(
+            "Total Microsoft Stack Cost",
+            f"${ms_total:,.2f}",
+            delta=f"${ms_total - pa_total:,.2f}"
+        )
+    
+    with col2:
+        st.metric(
+            "Total Azure Power Apps Cost",
+            f"${pa_total:,.2f}",
+            delta=f"${pa_total - ms_total:,.2f}"
+        )
+
+def render_features_tab():
+    st.header("Feature Comparison")
+    
+    # Display feature comparison as a styled table
+    st.markdown(features_html(df_features), unsafe_allow_html=True)
+    
     # Add legend for symbols
     st.markdown("---")
     st.markdown("### Legend")
@@ -371,7 +527,9 @@ with tab4:
     with col3:
         st.markdown("❌ - Not Supported")
 
-with tab5:
+# Runs as a fragment so slider drags rerun only this tab, not the whole page
+@st.fragment
+def render_roi_tab():
     st.header("ROI Calculator")
     
     col1, col2 = st.columns(2)
@@ -383,19 +541,6 @@ with tab5:
         complexity = st.selectbox("Project Complexity", ["Low", "Medium", "High"])
         expected_roi = st.slider("Expected ROI (%)", 0, 200, 100)
 
-    # Calculate estimated costs and ROI
-    def calculate_costs_and_roi(users, months, complexity, roi_percentage):
-        complexity_factor = {"Low": 0.8, "Medium": 1.0, "High": 1.3}
-        factor = complexity_factor[complexity]
-        
-        ms_stack_cost = (users * 100 * months + 50000) * factor
-        power_apps_cost = (users * 40 * months + 30000) * factor
-        
-        ms_roi = (ms_stack_cost * (1 + roi_percentage/100)) - ms_stack_cost
-        pa_roi = (power_apps_cost * (1 + roi_percentage/100)) - power_apps_cost
-        
-        return ms_stack_cost, power_apps_cost, ms_roi, pa_roi
-
     ms_cost, pa_cost, ms_roi, pa_roi = calculate_costs_and_roi(
         num_users, project_months, complexity, expected_roi
     )
@@ -411,6 +556,30 @@ with tab5:
         st.metric("Microsoft Stack Expected ROI", f"${ms_roi:,.2f}")
         st.metric("Azure Power Apps Expected ROI", f"${pa_roi:,.2f}")
 
+# Create tabs with enhanced styling
+tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    "📊 Comparison Matrix",
+    "⏱️ Timeline Analysis",
+    "💰 Cost Analysis",
+    "✨ Feature Comparison",
+    "📈 ROI Calculator"
+])
+
+with tab1:
+    render_comparison_tab()
+
+with tab2:
+    render_timeline_tab()
+
+with tab3:
+    render_cost_tab()
+
+with tab4:
+    render_features_tab()
+
+with tab5:
+    render_roi_tab()
+
 # Enhanced recommendations section
 st.markdown("---")
 st.header("📋 Analysis Summary & Recommendations")
@@ -418,44 +587,10 @@ st.header("📋 Analysis Summary & Recommendations")
 col1, col2 = st.columns(2)
 
 with col1:
-    st.markdown("""
-    ### Key Findings
-    
-    1. 🚀 **Development Speed**
-       - Azure Power Apps shows significant advantages in rapid development
-       - Faster time-to-market by approximately 30%
-    
-    2. 💰 **Cost Structure**
-       - Initial costs vary by implementation scope
-       - Long-term TCO generally favors Azure Power Apps
-    
-    3. 📈 **Scalability**
-       - Azure Power Apps provides better built-in scalability
-       - Lower infrastructure management overhead
-    
-    4. 🛠️ **Customization**
-       - Traditional Microsoft Stack offers more flexibility
-       - Better suited for complex custom requirements
-    """)
+    st.markdown(KEY_FINDINGS_MD)
 
 with col2:
-    st.markdown("""
-    ### Recommended Approach
-    
-    #### Azure Power Apps Focus:
-    - Standard workflows
-    - User interfaces
-    - Basic business processes
-    - Mobile access requirements
-    - Rapid prototyping needs
-    
-    #### Traditional Microsoft Stack Focus:
-    - Complex calculations
-    - Custom integrations
-    - Performance-critical operations
-    - Legacy system interfaces
-    - Specialized security requirements
-    """)
+    st.markdown(RECOMMENDED_APPROACH_MD)
 
 # Add export functionality
 st.markdown("---")
@@ -468,19 +603,17 @@ with col1:
         st.info("Full report export will be available in the next version")
 
 with col2:
-    if st.button("Export Comparison Data"):
-        st.download_button(
-            label="Download Comparison CSV",
-            data=df_comparison.to_csv(index=False),
-            file_name="comparison_data.csv",
-            mime="text/csv"
-        )
+    st.download_button(
+        label="Export Comparison Data",
+        data=to_csv_bytes(df_comparison),
+        file_name="comparison_data.csv",
+        mime="text/csv"
+    )
 
 with col3:
-    if st.button("Export Cost Analysis"):
-        st.download_button(
-            label="Download Cost Analysis CSV",
-            data=df_costs.to_csv(index=False),
-            file_name="cost_analysis.csv",
-            mime="text/csv"
-        )
\ No newline at end of file
+    st.download_button(
+        label="Export Cost Analysis",
+        data=to_csv_bytes(df_costs),
+        file_name="cost_analysis.csv",
+        mime="text/csv"
+    )
\ No newline at end of file